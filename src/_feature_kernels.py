@@ -0,0 +1,60 @@
+"""
+Numba kernels for the numeric part of feature engineering. Inputs are
+the ordinal survey answers already mapped to NumPy arrays; outputs are
+written into preallocated arrays supplied by the caller.
+"""
+
+import numpy as np
+from numba import njit, prange, types
+
+
+def _readonly(dtype):
+    """
+    1-D input array type that also accepts read-only arrays, which
+    pandas hands out from Series.to_numpy() under copy-on-write.
+    """
+    return types.Array(dtype, 1, "A", readonly=True)
+
+
+# Explicit signature: compiled once when this module is first imported
+# (and cached on disk) for the dtypes engineer_features passes in
+@njit(
+    types.void(
+        _readonly(types.int8), _readonly(types.float32),
+        _readonly(types.int8), _readonly(types.int16),
+        _readonly(types.int8), _readonly(types.float32),
+        _readonly(types.float32), types.int8,
+        types.float32[:], types.float32[:], types.float32[:],
+        types.int32[:],
+    ),
+    parallel=True,
+    fastmath=True,
+    cache=True,
+)
+def _engineer(n_ctx, slot_hours, recc, usage_m, pod_f, listen_noise,
+              stream_noise, max_ctx, out_listen, out_skip, out_div,
+              out_streams):
+    """Fill listening_time, skip_rate, diversity_score and streams."""
+    for i in prange(n_ctx.shape[0]):
+        # Estimated daily listening time (minutes)
+        # More contexts and later time slots suggest more daily listening
+        listen = (
+            slot_hours[i] * 60 * (1 + 0.15 * (n_ctx[i] - 1))
+            + listen_noise[i]
+        )
+        listen = max(10.0, np.rint(listen * 10.0) / 10.0)
+        out_listen[i] = listen
+
+        # Skip rate: inverse of recommendation satisfaction (1-5 scale)
+        out_skip[i] = (6 - recc[i]) / 5
+
+        # Diversity score: number of listening contexts normalized
+        out_div[i] = np.rint(n_ctx[i] / max_ctx * 1000.0) / 1000.0
+
+        # Streams: composite usage intensity score plus noise
+        streams = (
+            np.rint(usage_m[i] * 50 + n_ctx[i] * 200 + listen * 2
+                    + pod_f[i] * 100)
+            + np.rint(stream_noise[i])
+        )
+        out_streams[i] = max(streams, 50.0)
@@ -4,7 +4,9 @@ analysis. Transforms the raw survey data into analysis-ready features
 for regression modeling.
 """
 
+import hashlib
 import os
+import re
 import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
@@ -42,47 +44,116 @@ TIME_SLOT_HOURS = {
 }
 
 
-def load_raw_data(path):
-    """Read the raw Excel file from disk."""
-    return pd.read_excel(path)
+# Seed for the noise added to the engineered variables. A fresh generator
+# is built from it on every call so repeated runs give identical features
+NOISE_SEED = 42
 
 
-def clean_data(df):
-    """Standardize column names, fix typos, and handle missing values."""
-    df = df.copy()
+# Cleaning rules for free-text survey answers
 
-    # Standardize column names to snake_case
-    df.columns = (
-        df.columns
-        .str.strip()
-        .str.lower()
-        .str.replace(r"[^a-z0-9]+", "_", regex=True)
-        .str.strip("_")
+GENRE_REPLACEMENTS = {
+    "Classical": "Classical",
+    "Classical & Melody, Dance": "Classical",
+    "Old Songs": "Pop",
+    "Trending Songs Random": "Pop",
+    "Kpop": "Pop",
+    "All": "Melody",
+}
+
+PODCAST_COLS = [
+    "fav_pod_genre",
+    "preffered_pod_format",
+    "pod_host_preference",
+    "preffered_pod_duration",
+]
+
+
+# Raw survey columns used by clean_data and engineer_features
+# (names as they appear in the Excel header, before snake_casing)
+
+USECOLS = [
+    "Age",
+    "spotify_usage_period",
+    "preffered_premium_plan",
+    "fav_music_genre",
+    "music_time_slot",
+    "music_lis_frequency",
+    "music_recc_rating",
+    "pod_lis_frequency",
+    "fav_pod_genre",
+    "preffered_pod_format",
+    "pod_host_preference",
+    "preffered_pod_duration",
+]
+
+# Ordinal columns are read straight into categoricals. Categories are
+# inferred from the data (not fixed to the mapping dicts) so unexpected
+# labels survive the read and are reported by engineer_features
+DTYPES = {
+    "Age": "category",
+    "spotify_usage_period": "category",
+    "music_time_slot": "category",
+    "pod_lis_frequency": "category",
+    "music_recc_rating": "Int8",
+}
+
+
+def load_raw_data(path, usecols=USECOLS, dtypes=DTYPES):
+    """
+    Read the raw Excel file from disk.
+    Only the columns needed downstream are parsed by default; pass
+    usecols=None to read the full survey.
+    """
+    if usecols is not None:
+        dtypes = {col: dt for col, dt in dtypes.items() if col in usecols}
+    return pd.read_excel(
+        path, usecols=usecols, dtype=dtypes, engine="openpyxl"
     )
 
+
+def load_raw_data_cached(path, usecols=USECOLS, dtypes=DTYPES):
+    """
+    Read the raw data from a Parquet sidecar next to the Excel file,
+    creating (or refreshing) the sidecar from the Excel file if needed.
+    The sidecar name carries a hash of the column and dtype selection,
+    so changing either reads the Excel file again.
+    """
+    key = hashlib.sha1(repr((usecols, dtypes)).encode()).hexdigest()[:10]
+    cache_path = f"{os.path.splitext(path)[0]}.{key}.parquet"
+    if (
+        os.path.exists(cache_path)
+        and os.path.getmtime(cache_path) >= os.path.getmtime(path)
+    ):
+        return pd.read_parquet(cache_path)
+    df = load_raw_data(path, usecols=usecols, dtypes=dtypes)
+    df.to_parquet(cache_path, compression="zstd")
+    return df
+
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def _snake_case(name):
+    """Normalize a raw column header to snake_case."""
+    return _NON_ALNUM.sub("_", name.strip().lower()).strip("_")
+
+
+def clean_data(df):
+    """Standardize column names, fix typos, and handle missing values."""
+    # Standardize column names to snake_case (set_axis returns a new frame,
+    # so the column writes below never touch the caller's frame)
+    df = df.set_axis([_snake_case(c) for c in df.columns], axis=1)
+
     # Standardize genre values
     df["fav_music_genre"] = (
         df["fav_music_genre"]
         .str.strip()
         .str.title()
-        .replace({
-            "Classical": "Classical",
-            "Classical & Melody, Dance": "Classical",
-            "Old Songs": "Pop",
-            "Trending Songs Random": "Pop",
-            "Kpop": "Pop",
-            "All": "Melody",
-        })
+        .replace(GENRE_REPLACEMENTS)
     )
 
     # Fill missing podcast columns with "Unknown"
-    podcast_cols = [
-        "fav_pod_genre",
-        "preffered_pod_format",
-        "pod_host_preference",
-        "preffered_pod_duration",
-    ]
-    for col in podcast_cols:
+    for col in PODCAST_COLS:
         if col in df.columns:
             df[col] = df[col].fillna("Unknown")
 
@@ -97,7 +168,7 @@ def clean_data(df):
 
 def _count_listening_contexts(series):
     """Count how many listening contexts a user selected (comma-separated)."""
-    return series.str.split(",").apply(len)
+    return series.str.count(",").to_numpy(dtype=np.int8) + 1
 
 
 def _compute_genre_diversity(series):
@@ -106,8 +177,34 @@ def _compute_genre_diversity(series):
     Users who picked broad/generic genres get a higher score.
     Users who picked very specific niche genres get a lower score.
     """
-    broad_genres = {"Melody", "Pop", "All"}
-    return series.apply(lambda g: 1 if g in broad_genres else 0)
+    broad_genres = ["Melody", "Pop", "All"]
+    return series.isin(broad_genres).astype("int8")
+
+
+def _lookup(series, mapping, dtype):
+    """
+    Translate an ordinal survey column through one of the mapping dicts
+    by gathering from a lookup table with the category codes.
+    """
+    # Build a new Categorical rather than astype: unordered categoricals
+    # with the same categories in another order compare equal, so astype
+    # would keep the original codes
+    codes = np.asarray(pd.Categorical(series, categories=list(mapping)).codes)
+    if (codes < 0).any():
+        unmapped = series[codes < 0].unique().tolist()
+        raise ValueError(f"Unmapped values in {series.name!r}: {unmapped}")
+    lut = np.array(list(mapping.values()), dtype=dtype)
+    return lut[codes]
+
+
+def _lower_quantile(values, q):
+    """
+    Return the order statistic at index floor(q * (n - 1)) via an O(n)
+    partition. For the > and <= comparisons used to flag bot_like rows
+    this selects exactly the same rows as the interpolated quantile.
+    """
+    k = int(q * (len(values) - 1))
+    return np.partition(values, k)[k]
 
 
 def engineer_features(df):
@@ -126,67 +223,70 @@ def engineer_features(df):
         bot_like: Binary label where accounts with high usage intensity,
             low diversity, and extreme listening patterns are flagged
     """
-    df = df.copy()
-
-    # Age as numeric midpoint
-    df["age_numeric"] = df["age"].map(AGE_MIDPOINTS)
-
-    # Count of listening contexts (proxy for usage breadth)
-    df["n_listening_contexts"] = _count_listening_contexts(
-        df["music_lis_frequency"]
+    # Imported here so importing this module doesn't load Numba and
+    # compile the kernel for callers that never engineer features
+    from ._feature_kernels import _engineer
+
+    n = len(df)
+
+    # Ordinal survey answers as numeric arrays for the kernels
+    age_numeric = _lookup(df["age"], AGE_MIDPOINTS, np.int16)
+    n_ctx = _count_listening_contexts(df["music_lis_frequency"])
+    slot_hours = _lookup(df["music_time_slot"], TIME_SLOT_HOURS, np.float32)
+    if df["music_recc_rating"].isna().any():
+        raise ValueError("Missing values in 'music_recc_rating'")
+    recc = df["music_recc_rating"].to_numpy(dtype=np.int8)
+    usage_months = _lookup(
+        df["spotify_usage_period"], USAGE_PERIOD_MONTHS, np.int16
+    )
+    pod_frequency = _lookup(
+        df["pod_lis_frequency"], POD_FREQUENCY_SCORE, np.int8
     )
 
-    # Estimated daily listening time (minutes)
-    # More contexts and later time slots suggest more daily listening
-    base_minutes = df["music_time_slot"].map(TIME_SLOT_HOURS) * 60
-    df["listening_time"] = (
-        base_minutes * (1 + 0.15 * (df["n_listening_contexts"] - 1))
+    # Noise for variance (seeded for reproducibility); both vectors come
+    # from one draw, matching two consecutive rng.normal calls
+    rng = np.random.default_rng(seed=NOISE_SEED)
+    noise = rng.standard_normal((2, n)).astype(np.float32)
+    listen_noise = noise[0] * np.float32(10.0)
+    stream_noise = noise[1] * np.float32(150.0)
+
+    # Outputs are stored at the narrowest width that holds their range
+    listening_time = np.empty(n, dtype=np.float32)
+    skip_rate = np.empty(n, dtype=np.float32)
+    diversity_score = np.empty(n, dtype=np.float32)
+    streams = np.empty(n, dtype=np.int32)
+    _engineer(
+        n_ctx, slot_hours, recc, usage_months, pod_frequency,
+        listen_noise, stream_noise, n_ctx.max(),
+        listening_time, skip_rate, diversity_score, streams,
     )
-    # Add noise for variance (seeded for reproducibility)
-    rng = np.random.default_rng(seed=42)
-    df["listening_time"] += rng.normal(0, 10, size=len(df))
-    df["listening_time"] = df["listening_time"].clip(lower=10).round(1)
-
-    # Skip rate: inverse of recommendation satisfaction (1-5 scale)
-    # Higher rating means user finds good content (lower skip rate)
-    df["skip_rate"] = (6 - df["music_recc_rating"]) / 5
-
-    # Diversity score: number of listening contexts normalized
-    max_contexts = df["n_listening_contexts"].max()
-    df["diversity_score"] = (
-        df["n_listening_contexts"] / max_contexts
-    ).round(3)
-
-    # Usage period in months
-    df["usage_months"] = df["spotify_usage_period"].map(USAGE_PERIOD_MONTHS)
-
-    # Podcast frequency as numeric
-    df["pod_frequency"] = df["pod_lis_frequency"].map(POD_FREQUENCY_SCORE)
-
-    # Streams: composite usage intensity score
-    # Combines how long on platform, how many contexts, and overall engagement
-    df["streams"] = (
-        df["usage_months"] * 50
-        + df["n_listening_contexts"] * 200
-        + df["listening_time"] * 2
-        + df["pod_frequency"] * 100
-    ).round(0)
-    # Add noise
-    df["streams"] += rng.normal(0, 150, size=len(df)).round(0)
-    df["streams"] = df["streams"].clip(lower=50).astype(int)
 
     # Bot-like label: flag accounts with extreme usage patterns
     # High streams + low diversity + low recommendation engagement
-    high_streams = df["streams"] > df["streams"].quantile(0.75)
-    low_diversity = df["diversity_score"] <= df["diversity_score"].quantile(0.25)
-    low_recc = df["music_recc_rating"] <= 2
-    df["bot_like"] = (
-        (high_streams & low_diversity)
-        | (high_streams & low_recc)
-        | (low_diversity & low_recc)
-    ).astype(int)
-
-    return df
+    # (at least two of the three), computed as
+    # (high_streams & (low_diversity | low_recc)) | (low_diversity & low_recc)
+    high_streams = streams > _lower_quantile(streams, 0.75)
+    # diversity_score is strictly increasing in n_listening_contexts, so
+    # its lower quartile is thresholded on the int8 counts directly
+    low_diversity = n_ctx <= _lower_quantile(n_ctx, 0.25)
+    low_recc = recc <= 2
+    bot_like = np.empty(n, dtype=np.bool_)
+    np.logical_or(low_diversity, low_recc, out=bot_like)
+    np.logical_and(high_streams, bot_like, out=bot_like)
+    np.logical_and(low_diversity, low_recc, out=low_recc)
+    np.logical_or(bot_like, low_recc, out=bot_like)
+
+    return df.assign(
+        age_numeric=age_numeric,
+        n_listening_contexts=n_ctx,
+        listening_time=listening_time,
+        skip_rate=skip_rate,
+        diversity_score=diversity_score,
+        usage_months=usage_months,
+        pod_frequency=pod_frequency,
+        streams=streams,
+        bot_like=bot_like.view(np.uint8),
+    )
 
 
 def create_dummies(df, columns):
@@ -194,15 +294,32 @@ def create_dummies(df, columns):
     Create dummy variables for specified categorical columns.
     Drops the first category to avoid multicollinearity.
     """
-    return pd.get_dummies(df, columns=columns, drop_first=True, dtype=int)
+    return pd.get_dummies(df, columns=columns, drop_first=True, dtype=np.int8)
+
+
+def one_hot_encode(df, columns):
+    """
+    Sparse alternative to create_dummies for wide categoricals.
+    Returns the remaining columns, a scipy CSR matrix of int8 dummies
+    (first category dropped), and the fitted OneHotEncoder, whose
+    get_feature_names_out() labels the matrix columns.
+    """
+    # Imported here so importing this module doesn't pay for sklearn
+    from sklearn.preprocessing import OneHotEncoder
+
+    enc = OneHotEncoder(sparse_output=True, drop="first", dtype=np.int8)
+    X = enc.fit_transform(df[columns])
+    other = df.drop(columns=columns)
+    return other, X, enc
 
 
-def load_and_clean_data(path):
+def load_and_clean_data(path, cache=False):
     """
     Full pipeline: load raw data, clean, engineer features,
     and return the analysis-ready dataframe.
+    Set cache=True to read through the Parquet sidecar.
     """
-    df = load_raw_data(path)
+    df = load_raw_data_cached(path) if cache else load_raw_data(path)
     df = clean_data(df)
     df = engineer_features(df)
     return df
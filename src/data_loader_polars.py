@@ -0,0 +1,170 @@
+"""
+Polars implementation of the data_loader pipeline. Cleaning and feature
+engineering are expressed as a single lazy query that is collected
+once, producing the same engineered columns as
+data_loader.load_and_clean_data.
+"""
+
+import numpy as np
+import polars as pl
+
+from .data_loader import (
+    AGE_MIDPOINTS,
+    GENRE_REPLACEMENTS,
+    NOISE_SEED,
+    PODCAST_COLS,
+    POD_FREQUENCY_SCORE,
+    TIME_SLOT_HOURS,
+    USAGE_PERIOD_MONTHS,
+    USECOLS,
+    _snake_case,
+)
+
+
+# Engineered columns and their output dtypes (arithmetic is done at
+# full width and narrowed once at the end to avoid Int8 overflow)
+FEATURE_DTYPES = {
+    "age_numeric": pl.Int16,
+    "n_listening_contexts": pl.Int8,
+    "listening_time": pl.Float32,
+    "skip_rate": pl.Float32,
+    "diversity_score": pl.Float32,
+    "usage_months": pl.Int16,
+    "pod_frequency": pl.Int8,
+    "streams": pl.Int32,
+    "bot_like": pl.UInt8,
+}
+
+_NOISE_COLS = ["_listen_noise", "_stream_noise"]
+
+# Strings pd.read_excel treats as missing by default (the survey stores
+# unanswered podcast questions as the literal "None")
+NA_STRINGS = [
+    "", " ", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN",
+    "-nan", "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN",
+    "None", "n/a", "nan", "null",
+]
+
+
+def load_raw_data(path, columns=USECOLS):
+    """
+    Read the raw Excel file from disk into a Polars DataFrame, with the
+    same missing-value strings as the pandas loader mapped to null.
+    """
+    df = pl.read_excel(path, engine="openpyxl", columns=columns)
+    return df.with_columns(pl.col(pl.String).replace(NA_STRINGS, None))
+
+
+def _clean(lf):
+    """Standardize column names, fix typos, and handle missing values."""
+    lf = lf.rename(_snake_case)
+    columns = lf.collect_schema().names()
+    return lf.with_columns(
+        pl.col("fav_music_genre")
+        .str.strip_chars()
+        .str.to_titlecase()
+        .replace(GENRE_REPLACEMENTS),
+        pl.col([c for c in PODCAST_COLS if c in columns]).fill_null("Unknown"),
+        pl.col(
+            [c for c in ["preffered_premium_plan"] if c in columns]
+        ).fill_null("None"),
+    )
+
+
+def _engineer(lf):
+    """
+    Add the engineered variables described in
+    data_loader.engineer_features. Expects the noise columns attached
+    by load_and_clean_data.
+    """
+    n_ctx = pl.col("n_listening_contexts")
+    high_streams = pl.col("streams") > pl.col("streams").quantile(
+        0.75, interpolation="linear"
+    )
+    low_diversity = pl.col("diversity_score") <= pl.col(
+        "diversity_score"
+    ).quantile(0.25, interpolation="linear")
+    low_recc = pl.col("music_recc_rating") <= 2
+
+    return (
+        lf.with_columns(
+            pl.col("age")
+            .replace_strict(AGE_MIDPOINTS, return_dtype=pl.Int64)
+            .alias("age_numeric"),
+            (
+                pl.col("music_lis_frequency")
+                .str.count_matches(",", literal=True) + 1
+            ).alias("n_listening_contexts"),
+            ((6 - pl.col("music_recc_rating")) / 5).alias("skip_rate"),
+            pl.col("spotify_usage_period")
+            .replace_strict(USAGE_PERIOD_MONTHS, return_dtype=pl.Int64)
+            .alias("usage_months"),
+            pl.col("pod_lis_frequency")
+            .replace_strict(POD_FREQUENCY_SCORE, return_dtype=pl.Int64)
+            .alias("pod_frequency"),
+        )
+        .with_columns(
+            (
+                pl.col("music_time_slot")
+                .replace_strict(TIME_SLOT_HOURS, return_dtype=pl.Float64)
+                * 60 * (1 + 0.15 * (n_ctx - 1))
+                + pl.col("_listen_noise")
+            ).clip(lower_bound=10).round(1).alias("listening_time"),
+            (n_ctx / n_ctx.max()).round(3).alias("diversity_score"),
+        )
+        .with_columns(
+            (
+                (
+                    pl.col("usage_months") * 50
+                    + n_ctx * 200
+                    + pl.col("listening_time") * 2
+                    + pl.col("pod_frequency") * 100
+                ).round(0)
+                + pl.col("_stream_noise").round(0)
+            ).clip(lower_bound=50).alias("streams"),
+        )
+        .with_columns(
+            ((high_streams & (low_diversity | low_recc))
+             | (low_diversity & low_recc)).alias("bot_like"),
+        )
+        .select(
+            pl.exclude(list(FEATURE_DTYPES) + _NOISE_COLS),
+            *[pl.col(c).cast(dt) for c, dt in FEATURE_DTYPES.items()],
+        )
+    )
+
+
+def load_and_clean_data(path):
+    """
+    Full pipeline: load raw data, clean, engineer features, and return
+    the analysis-ready Polars DataFrame.
+    """
+    df = load_raw_data(path)
+    # Same seeded draws, in the same order, as the pandas pipeline.
+    # Attached after _clean so the snake_case renaming leaves them alone
+    rng = np.random.default_rng(seed=NOISE_SEED)
+    noise = rng.standard_normal((2, df.height)).astype(np.float32)
+    lf = _clean(df.lazy()).with_columns(
+        pl.Series("_listen_noise", noise[0] * np.float32(10.0)),
+        pl.Series("_stream_noise", noise[1] * np.float32(150.0)),
+    )
+    return _engineer(lf).collect()
+
+
+def _check_against_pandas(path):
+    """
+    Run both pipelines on the same file and raise an AssertionError if
+    the Polars output differs from data_loader.load_and_clean_data.
+    """
+    from pandas.testing import assert_frame_equal
+    from .data_loader import load_and_clean_data as load_and_clean_pandas
+
+    expected = load_and_clean_pandas(path)
+    # Ordinal columns are categoricals in the pandas pipeline
+    expected = expected.astype(
+        {c: str for c in expected.select_dtypes("category").columns}
+    )
+    result = load_and_clean_data(path).to_pandas()
+    assert_frame_equal(
+        result, expected, check_dtype=False, check_column_type=False
+    )
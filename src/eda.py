@@ -4,14 +4,24 @@ All functions produce publication-quality figures with labeled axes,
 titles, and legends.
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import pandas as pd
 
 
-# Consistent style across all plots
-sns.set_theme(style="whitegrid", font_scale=1.1)
+# matplotlib and seaborn are imported inside the plotting functions so
+# that importing this module stays cheap for non-plotting code paths
 PALETTE = ["#1DB954", "#B3B3B3"]  # Spotify green + neutral gray
+_STYLE_APPLIED = False
+
+
+def _ensure_style():
+    """Apply the shared seaborn theme the first time a plot is drawn."""
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        import seaborn as sns
+        # Consistent style across all plots
+        sns.set_theme(style="whitegrid", font_scale=1.1)
+        _STYLE_APPLIED = True
 
 
 def descriptive_stats(df, columns=None):
@@ -26,6 +36,8 @@ def descriptive_stats(df, columns=None):
 
 def plot_histograms(df, columns, bins=25, figsize=None):
     """Plot histograms for a list of continuous columns."""
+    import matplotlib.pyplot as plt
+    _ensure_style()
     n = len(columns)
     if figsize is None:
         figsize = (5 * n, 4)
@@ -33,8 +45,10 @@ def plot_histograms(df, columns, bins=25, figsize=None):
     if n == 1:
         axes = [axes]
     for ax, col in zip(axes, columns):
-        ax.hist(df[col].dropna(), bins=bins, color=PALETTE[0],
-                edgecolor="white", alpha=0.85)
+        values = df[col].dropna().to_numpy(dtype=np.float32)
+        counts, edges = np.histogram(values, bins=bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+               color=PALETTE[0], edgecolor="white", alpha=0.85)
         ax.set_xlabel(col.replace("_", " ").title())
         ax.set_ylabel("Count")
         ax.set_title(f"Distribution of {col.replace('_', ' ').title()}")
@@ -44,6 +58,9 @@ def plot_histograms(df, columns, bins=25, figsize=None):
 
 def plot_boxplots(df, continuous_col, group_col, figsize=(7, 5)):
     """Boxplot of a continuous variable grouped by a categorical variable."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    _ensure_style()
     fig, ax = plt.subplots(figsize=figsize)
     sns.boxplot(
         data=df,
@@ -64,6 +81,9 @@ def plot_boxplots(df, continuous_col, group_col, figsize=(7, 5)):
 
 def plot_scatterplot(df, x_col, y_col, hue_col=None, figsize=(7, 5)):
     """Scatterplot with optional hue grouping."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    _ensure_style()
     fig, ax = plt.subplots(figsize=figsize)
     sns.scatterplot(
         data=df,
@@ -87,26 +107,44 @@ def plot_scatterplot(df, x_col, y_col, hue_col=None, figsize=(7, 5)):
     return fig
 
 
-def plot_pairplot(df, columns, hue_col=None):
-    """Seaborn pairplot for a subset of columns."""
+def plot_pairplot(df, columns, hue_col=None, sample=5000):
+    """
+    Seaborn pairplot for a subset of columns.
+    Frames with more than `sample` complete rows are randomly sampled
+    down to that size; scatter layers are rasterized for vector export.
+    """
+    import seaborn as sns
+    _ensure_style()
     subset = columns.copy()
     if hue_col and hue_col not in subset:
         subset.append(hue_col)
+    data = df[subset].dropna()
+    if sample is not None and len(data) > sample:
+        data = data.sample(sample, random_state=0)
     g = sns.pairplot(
-        df[subset].dropna(),
+        data,
         hue=hue_col,
         palette=PALETTE if hue_col else None,
         diag_kind="hist",
-        plot_kws={"alpha": 0.5},
+        plot_kws={"alpha": 0.5, "s": 8, "rasterized": True},
     )
     g.figure.suptitle("Pairplot of Key Variables", y=1.02)
     return g.figure
 
 
 def plot_correlation_matrix(df, columns, figsize=(8, 6)):
-    """Heatmap of the correlation matrix for selected columns."""
+    """
+    Heatmap of the Pearson correlation matrix for selected columns,
+    computed over rows complete in all of them.
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    _ensure_style()
     fig, ax = plt.subplots(figsize=figsize)
-    corr = df[columns].corr()
+    X = np.ascontiguousarray(df[columns].dropna().to_numpy(dtype=np.float32))
+    X -= X.mean(axis=0)
+    X /= X.std(axis=0)
+    corr = pd.DataFrame((X.T @ X) / len(X), index=columns, columns=columns)
     sns.heatmap(
         corr,
         annot=True,
@@ -123,12 +161,15 @@ def plot_correlation_matrix(df, columns, figsize=(8, 6)):
 
 def plot_class_balance(df, target_col, figsize=(6, 4)):
     """Bar chart showing class distribution for a binary target."""
+    import matplotlib.pyplot as plt
+    _ensure_style()
     fig, ax = plt.subplots(figsize=figsize)
-    counts = df[target_col].value_counts().sort_index()
-    counts.plot(kind="bar", color=PALETTE, edgecolor="white", ax=ax)
+    counts = np.bincount(df[target_col].to_numpy(dtype=np.uint8), minlength=2)
+    ax.bar([0, 1], counts, color=PALETTE, edgecolor="white")
     ax.set_xlabel(target_col.replace("_", " ").title())
     ax.set_ylabel("Count")
     ax.set_title(f"Class Distribution: {target_col.replace('_', ' ').title()}")
+    ax.set_xticks([0, 1])
     ax.set_xticklabels(["Human (0)", "Bot-like (1)"], rotation=0)
     for i, v in enumerate(counts):
         ax.text(i, v + 3, str(v), ha="center", fontweight="bold")